@@ -0,0 +1,66 @@
+import os
+import logging
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from src.audio_normalize import _encoder_args
+
+logger = logging.getLogger(__name__)
+
+
+def convert_to_mp3(input_file, ffmpeg_path, bitrate=None, encoder="libmp3lame"):
+    """
+    Convert a downloaded audio stream (webm, m4a, opus...) to MP3 and remove the source.
+
+    Args:
+        input_file (str): Path to downloaded audio file
+        ffmpeg_path (str): Path to ffmpeg executable (optional, will use PATH if not provided)
+        bitrate (str): Output bitrate in kbps (default: None, best VBR quality)
+        encoder (str): ffmpeg MP3 encoder (default: libmp3lame)
+
+    Returns:
+        str: Path to the MP3 file
+    """
+    if not os.path.isfile(input_file):
+        logger.error(f"❌ ERROR: Downloaded file not found: {input_file}")
+        sys.exit(1)
+
+    output_file = os.path.splitext(input_file)[0] + ".mp3"
+
+    # Encode to a temporary file next to the output, so that a failed or
+    # interrupted conversion never leaves a truncated MP3 behind
+    temp_fd, temp_file = tempfile.mkstemp(
+        suffix=".mp3", dir=os.path.dirname(output_file)
+    )
+    os.close(temp_fd)
+
+    cmd = [
+        ffmpeg_path if ffmpeg_path else "ffmpeg",
+        "-i",
+        input_file,
+        "-vn",  # Drop any video stream
+        # Same encoder settings as normalized files
+        *_encoder_args(bitrate, encoder),
+        "-y",  # Overwrite output file
+        temp_file,
+    ]
+
+    # Run ffmpeg (suppress output)
+    result = subprocess.run(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+
+    if result.returncode != 0:
+        logger.error(f"❌ ERROR: Failed to convert {os.path.basename(input_file)} to MP3")
+        logger.error(f"ffmpeg error: {result.stderr}")
+        os.remove(temp_file)
+        sys.exit(1)
+
+    # mkstemp creates the file as 0600: keep the permissions of the download instead
+    shutil.copymode(input_file, temp_file)
+    os.replace(temp_file, output_file)
+    if input_file != output_file:
+        os.remove(input_file)
+    return output_file
@@ -1,11 +1,208 @@
 import os
+import logging
+import re
+import json
+import math
+import functools
 import subprocess
 import sys
 import tempfile
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+logger = logging.getLogger(__name__)
 
-def normalize_audio_volume(input_file, ffmpeg_path, target_lufs=-23.0):
+# Number of files normalized by a single ffmpeg invocation
+NORMALIZE_BATCH_SIZE = 8
+
+# Cache of already normalized files, stored in the output directory
+NORMALIZE_CACHE_FILENAME = ".normalized.json"
+
+# JSON statistics printed by each loudnorm instance (print_format=json)
+_LOUDNORM_STATS_RE = re.compile(r"\[Parsed_loudnorm_(\d+) @ [^\]]*\]\s*(\{.*?\})", re.DOTALL)
+
+
+def _iter_mp3s(output_dir):
+    """
+    Iterate over the MP3 files of a directory.
+    Uses the cached directory entry type, so no stat call is made per file.
+
+    Args:
+        output_dir (str): Directory containing MP3 files
+
+    Yields:
+        str: Path to each MP3 file
+    """
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(".mp3"):
+                yield entry.path
+
+
+def _file_signature(file_stat):
+    """
+    Build the cache signature of a normalized file.
+
+    Args:
+        file_stat (os.stat_result): Result of os.stat on the audio file
+
+    Returns:
+        list: [size, mtime in ns] (a list, to compare equal once loaded from JSON)
+    """
+    return [file_stat.st_size, file_stat.st_mtime_ns]
+
+
+def _cache_entry(file_stat, target_lufs, loudness):
+    """
+    Build the cache entry of a file just normalized.
+
+    Args:
+        file_stat (os.stat_result): Result of os.stat on the normalized audio file
+        target_lufs (float): Target integrated loudness in LUFS
+        loudness (dict): Loudness of the normalized file (see normalize_audio_volume)
+
+    Returns:
+        dict: {"signature", "target_lufs", "loudness"}
+    """
+    return {
+        "signature": _file_signature(file_stat),
+        "target_lufs": target_lufs,
+        "loudness": loudness,
+    }
+
+
+def _load_normalize_cache(output_dir):
+    """
+    Load the cache of already normalized files.
+
+    Args:
+        output_dir (str): Directory containing MP3 files
+
+    Returns:
+        dict: File name -> {"signature", "target_lufs", "loudness"} recorded after normalization
+    """
+    cache_path = os.path.join(output_dir, NORMALIZE_CACHE_FILENAME)
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        # Missing or unreadable cache: everything will be normalized again
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_normalize_cache(output_dir, cache):
+    """
+    Atomically write the cache of already normalized files.
+
+    Args:
+        output_dir (str): Directory containing MP3 files
+        cache (dict): File name -> {"signature", "target_lufs", "loudness"} recorded after normalization
+    """
+    temp_fd, temp_file = tempfile.mkstemp(suffix=".json", dir=output_dir)
+    with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+    os.replace(temp_file, os.path.join(output_dir, NORMALIZE_CACHE_FILENAME))
+
+
+def _loudnorm_filter(target_lufs, measured=None):
+    """
+    Build the loudnorm filter expression for the target loudness.
+
+    Args:
+        target_lufs (float): Target integrated loudness in LUFS
+        measured (dict): Known loudness of the input ("I", "TP", "LRA", "thresh"), if any
+
+    Returns:
+        str: ffmpeg loudnorm filter
+    """
+    # Using single-pass normalization (faster, slightly less accurate than two-pass)
+    # Default target: -23 LUFS (EBU R128 broadcast standard, similar to MP3Gain default)
+    # Statistics of the output are printed so the next run can skip the analysis
+    loudnorm = f"loudnorm=I={target_lufs}:TP=-2.0:LRA=11:print_format=json"
+    if measured:
+        # Input already measured: apply a linear gain instead of re-analyzing
+        # (no offset=: linear mode replaces it with target I - measured I, and the
+        # target_offset printed by loudnorm only holds for the previous target)
+        loudnorm += (
+            f":measured_I={measured['I']}:measured_TP={measured['TP']}"
+            f":measured_LRA={measured['LRA']}:measured_thresh={measured['thresh']}"
+            ":linear=true"
+        )
+    return loudnorm
+
+
+def _parse_loudnorm_stats(stderr, count):
+    """
+    Extract the output loudness printed by loudnorm instances (print_format=json).
+
+    Args:
+        stderr (str): ffmpeg stderr output
+        count (int): Number of loudnorm instances in the filter graph
+
+    Returns:
+        list: Per instance {"I", "TP", "LRA", "thresh"} of the normalized output
+            (None when missing or not usable as measured values, e.g. silent audio)
+    """
+    stats = [None] * count
+    for match in _LOUDNORM_STATS_RE.finditer(stderr):
+        index = int(match.group(1))
+        try:
+            report = json.loads(match.group(2))
+            loudness = {
+                "I": float(report["output_i"]),
+                "TP": float(report["output_tp"]),
+                "LRA": float(report["output_lra"]),
+                "thresh": float(report["output_thresh"]),
+            }
+        except (ValueError, KeyError):
+            continue
+        if index < count and all(math.isfinite(v) for v in loudness.values()):
+            stats[index] = loudness
+    return stats
+
+
+def _encoder_args(bitrate, encoder="libmp3lame"):
+    """
+    Build the ffmpeg output options used to encode normalized MP3 files.
+
+    Args:
+        bitrate (str): Output bitrate in kbps (None for best quality)
+        encoder (str): ffmpeg MP3 encoder (default: libmp3lame)
+
+    Returns:
+        list: ffmpeg output arguments
+    """
+    # Explicit encoder settings: ffmpeg defaults to 128 kbps otherwise
+    if bitrate:
+        quality_args = ["-b:a", f"{bitrate}k"]
+    elif encoder == "libmp3lame":
+        quality_args = ["-q:a", "0"]
+    else:
+        # Other encoders are CBR only
+        quality_args = ["-b:a", "320k"]
+
+    return [
+        "-threads",
+        "1",  # Files are processed in parallel, one core per ffmpeg process
+        "-ar",
+        "44100",  # CD rate (loudnorm upsamples to 192 kHz internally)
+        "-c:a",
+        encoder,
+        *quality_args,
+    ]
+
+
+def normalize_audio_volume(
+    input_file,
+    ffmpeg_path,
+    target_lufs=-23.0,
+    bitrate=None,
+    measured=None,
+    encoder="libmp3lame",
+    output_file=None,
+):
     """
     Normalize audio volume using ffmpeg loudnorm filter (EBU R128 standard).
     Similar to MP3Gain but using modern loudness normalization.
@@ -14,31 +211,43 @@ def normalize_audio_volume(input_file, ffmpeg_path, target_lufs=-23.0):
         input_file (str): Path to input audio file
         ffmpeg_path (str): Path to ffmpeg executable
         target_lufs (float): Target integrated loudness in LUFS (default: -23.0, EBU R128 standard)
+        bitrate (str): Output bitrate in kbps (default: None, best VBR quality)
+        measured (dict): Known loudness of the input, skips loudnorm analysis (default: None)
+        encoder (str): ffmpeg MP3 encoder (default: libmp3lame)
+        output_file (str): Path to the normalized MP3 file, in the same directory
+            (default: None, replaces the input file)
 
     Returns:
-        bool: True if normalization succeeded, False otherwise
+        dict: Loudness of the normalized file ("I", "TP", "LRA", "thresh"), or None if unknown
     """
-    if not os.path.exists(input_file):
-        print(f"❌ ERROR: Input file not found: {input_file}")
+    # A single stat reports a missing input and gives the mode kept on the output
+    try:
+        input_stat = os.stat(input_file)
+    except FileNotFoundError:
+        logger.error(f"❌ ERROR: Input file not found: {input_file}")
         sys.exit(1)
 
+    if output_file is None:
+        output_file = input_file
+
     # Create temporary file for output
+    # Same directory as the output, so os.replace below never crosses filesystems.
+    # ffmpeg writes to the path rather than to a pipe: the MP3 muxer needs a
+    # seekable output to fill in the Xing/LAME header (VBR duration and seeking)
     temp_fd, temp_file = tempfile.mkstemp(
-        suffix=".mp3", dir=os.path.dirname(input_file)
+        suffix=".mp3", dir=os.path.dirname(output_file)
     )
     os.close(temp_fd)
 
     # Build ffmpeg command with loudnorm filter
-    # Using single-pass normalization (faster, slightly less accurate than two-pass)
-    # Target: -23 LUFS (EBU R128 broadcast standard, similar to MP3Gain default)
     cmd = [
         ffmpeg_path,
         "-i",
         input_file,
+        "-vn",  # Drop any video stream (the input may be a downloaded video)
         "-af",
-        f"loudnorm=I={target_lufs}:TP=-2.0:LRA=11",
-        "-ar",
-        "44100",  # Maintain sample rate
+        _loudnorm_filter(target_lufs, measured),
+        *_encoder_args(bitrate, encoder),
         "-y",  # Overwrite output file
         temp_file,
     ]
@@ -49,17 +258,134 @@ def normalize_audio_volume(input_file, ffmpeg_path, target_lufs=-23.0):
     )
 
     if result.returncode != 0:
-        print(f"❌ ERROR: Failed to normalize {os.path.basename(input_file)}")
-        print(f"ffmpeg error: {result.stderr}")
+        logger.error(f"❌ ERROR: Failed to normalize {os.path.basename(input_file)}")
+        logger.error(f"ffmpeg error: {result.stderr}")
         os.remove(temp_file)
         sys.exit(1)
 
+    # mkstemp creates the file as 0600: keep the permissions of the input instead
+    os.chmod(temp_file, stat.S_IMODE(input_stat.st_mode))
     # Replace original file with normalized version
-    os.replace(temp_file, input_file)
-    return True
+    os.replace(temp_file, output_file)
+    return _parse_loudnorm_stats(result.stderr, 1)[0]
+
+
+def normalize_audio_batch(
+    input_files,
+    ffmpeg_path,
+    target_lufs=-23.0,
+    bitrate=None,
+    measured=None,
+    encoder="libmp3lame",
+):
+    """
+    Normalize several audio files with a single ffmpeg invocation.
+    Each input gets its own loudnorm instance in a filter_complex graph, which
+    amortizes ffmpeg startup over the batch. Falls back to one ffmpeg process
+    per file if the batch fails.
+
+    Args:
+        input_files (list): Paths to input audio files
+        ffmpeg_path (str): Path to ffmpeg executable
+        target_lufs (float): Target integrated loudness in LUFS (default: -23.0, EBU R128 standard)
+        bitrate (str): Output bitrate in kbps (default: None, best VBR quality)
+        measured (list): Known loudness of each input (or None), skips loudnorm analysis
+        encoder (str): ffmpeg MP3 encoder (default: libmp3lame)
+
+    Returns:
+        list: Loudness of each normalized file (see normalize_audio_volume)
+    """
+    if measured is None:
+        measured = [None] * len(input_files)
+
+    if len(input_files) == 1:
+        return [
+            normalize_audio_volume(
+                input_files[0],
+                ffmpeg_path,
+                target_lufs,
+                bitrate,
+                measured[0],
+                encoder=encoder,
+            )
+        ]
+
+    # No existence check per input: a missing file fails the batch, and the
+    # per-file fallback below reports it
+    # Create one temporary output file per input
+    temp_files = []
+    for input_file in input_files:
+        temp_fd, temp_file = tempfile.mkstemp(
+            suffix=".mp3", dir=os.path.dirname(input_file)
+        )
+        os.close(temp_fd)
+        temp_files.append(temp_file)
+
+    # Build ffmpeg command: [0:a]loudnorm[a0];[1:a]loudnorm[a1];...
+    filter_graph = ";".join(
+        f"[{index}:a]{_loudnorm_filter(target_lufs, measured[index])}[a{index}]"
+        for index in range(len(input_files))
+    )
+    cmd = [ffmpeg_path]
+    for input_file in input_files:
+        cmd += ["-i", input_file]
+    cmd += ["-filter_complex", filter_graph]
+    for index, temp_file in enumerate(temp_files):
+        cmd += ["-map", f"[a{index}]", *_encoder_args(bitrate, encoder), "-y", temp_file]
+
+    # Run ffmpeg (suppress output)
+    result = subprocess.run(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+
+    if result.returncode != 0:
+        # Batch failed (e.g. one unreadable input): retry file by file for a precise error
+        for temp_file in temp_files:
+            os.remove(temp_file)
+        return [
+            normalize_audio_volume(
+                input_file,
+                ffmpeg_path,
+                target_lufs,
+                bitrate,
+                input_measured,
+                encoder=encoder,
+            )
+            for input_file, input_measured in zip(input_files, measured)
+        ]
+
+    # Replace original files with normalized versions (keeping their permissions)
+    for input_file, temp_file in zip(input_files, temp_files):
+        shutil.copymode(input_file, temp_file)
+        os.replace(temp_file, input_file)
+    return _parse_loudnorm_stats(result.stderr, len(input_files))
 
 
-def normalize_all_mp3_files(output_dir, ffmpeg_path, target_lufs=-23.0):
+def record_normalized_files(output_dir, loudness_stats, target_lufs=-23.0):
+    """
+    Add files normalized with normalize_audio_volume to the cache of the directory,
+    so that normalize_all_mp3_files does not normalize them again.
+
+    Args:
+        output_dir (str): Directory containing MP3 files
+        loudness_stats (dict): Path of each normalized file -> its loudness
+            (see normalize_audio_volume)
+        target_lufs (float): Target integrated loudness in LUFS (default: -23.0)
+    """
+    if not loudness_stats:
+        return
+
+    cache = _load_normalize_cache(output_dir)
+    for mp3_file, loudness in loudness_stats.items():
+        cache[os.path.basename(mp3_file)] = _cache_entry(
+            os.stat(mp3_file), target_lufs, loudness
+        )
+    _save_normalize_cache(output_dir, cache)
+
+
+def normalize_all_mp3_files(
+    output_dir, ffmpeg_path, target_lufs=-23.0, bitrate=None, encoder="libmp3lame"
+):
     """
     Normalize volume of all MP3 files in a directory.
 
@@ -67,26 +393,60 @@ def normalize_all_mp3_files(output_dir, ffmpeg_path, target_lufs=-23.0):
         output_dir (str): Directory containing MP3 files
         ffmpeg_path (str): Path to ffmpeg executable
         target_lufs (float): Target integrated loudness in LUFS (default: -23.0)
+        bitrate (str): Output bitrate in kbps (default: None, best VBR quality)
+        encoder (str): ffmpeg MP3 encoder (default: libmp3lame)
     """
     from tqdm import tqdm
 
-    if not os.path.exists(output_dir):
-        print(f"❌ ERROR: Output directory not found: {output_dir}")
+    # Find all MP3 files
+    try:
+        mp3_files = list(_iter_mp3s(output_dir))
+    except FileNotFoundError:
+        logger.error(f"❌ ERROR: Output directory not found: {output_dir}")
         sys.exit(1)
 
-    # Find all MP3 files
+    if not mp3_files:
+        logger.warning("⚠️  No MP3 files found to normalize.")
+        return
+
+    # Skip files left unchanged since their last normalization to the same target
+    # (entries of files no longer in the directory are dropped)
+    mp3_names = {os.path.basename(f) for f in mp3_files}
+    # Entries of files modified since are unusable and dropped too
+    cache = {
+        name: entry
+        for name, entry in _load_normalize_cache(output_dir).items()
+        if name in mp3_names
+        and isinstance(entry, dict)
+        and entry.get("signature")
+        == _file_signature(os.stat(os.path.join(output_dir, name)))
+    }
     mp3_files = [
-        os.path.join(output_dir, f)
-        for f in os.listdir(output_dir)
-        if f.lower().endswith(".mp3") and os.path.isfile(os.path.join(output_dir, f))
+        f
+        for f in mp3_files
+        if cache.get(os.path.basename(f), {}).get("target_lufs") != target_lufs
     ]
+    skipped_count = len(mp3_names) - len(mp3_files)
 
+    if skipped_count:
+        logger.info(f"\n♻️  {skipped_count} file(s) already normalized, skipping.")
     if not mp3_files:
-        print("⚠️  No MP3 files found to normalize.")
+        logger.info("\n✅ Volume normalization completed successfully!")
         return
 
-    print(f"\n🔊 Normalizing volume for {len(mp3_files)} file(s)...")
-    print(f"🎚️  Target loudness: {target_lufs} LUFS (EBU R128 standard)")
+    logger.info(f"\n🔊 Normalizing volume for {len(mp3_files)} file(s)...")
+    logger.info(f"🎚️  Target loudness: {target_lufs} LUFS (EBU R128 standard)")
+
+    # Split files into batches, keeping enough batches to use every core
+    max_workers = os.cpu_count() or 1
+    batch_size = max(1, min(NORMALIZE_BATCH_SIZE, len(mp3_files) // max_workers))
+    batches = [
+        mp3_files[i : i + batch_size] for i in range(0, len(mp3_files), batch_size)
+    ]
+    # Loudness measured at the previous run (another target): no analysis needed
+    measured = {
+        f: cache.get(os.path.basename(f), {}).get("loudness") for f in mp3_files
+    }
 
     # Use progress bar for normalization
     with tqdm(
@@ -95,19 +455,86 @@ def normalize_all_mp3_files(output_dir, ffmpeg_path, target_lufs=-23.0):
         unit="file",
         bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
         ncols=100,
-    ) as pbar:
-        for mp3_file in mp3_files:
-            filename = os.path.basename(mp3_file)
-            pbar.set_postfix_str(filename[:40] if len(filename) <= 40 else filename[:37] + "...")
-            normalize_audio_volume(mp3_file, ffmpeg_path, target_lufs)
-            pbar.update(1)
+        mininterval=0.5,  # Limit terminal redraws when files complete quickly
+        miniters=1,
+    ) as pbar, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Each task runs its own ffmpeg subprocess, so threads are enough
+        futures = {
+            executor.submit(
+                normalize_audio_batch,
+                batch,
+                ffmpeg_path,
+                target_lufs,
+                bitrate,
+                [measured[f] for f in batch],
+                encoder=encoder,
+            ): batch
+            for batch in batches
+        }
+
+        def record(future):
+            """Add the files of a completed batch to the cache, re-raising its error."""
+            loudness_stats = future.result()
+            for mp3_file, loudness in zip(futures[future], loudness_stats):
+                cache[os.path.basename(mp3_file)] = _cache_entry(
+                    os.stat(mp3_file), target_lufs, loudness
+                )
+            return loudness_stats
+
+        recorded = set()
+        try:
+            for future in as_completed(futures):
+                # Re-raise worker errors (including sys.exit) in the main thread
+                loudness_stats = record(future)
+                recorded.add(future)
+                filename = os.path.basename(futures[future][-1])
+                # Postfix is drawn with the next throttled update, not immediately
+                pbar.set_postfix_str(
+                    filename[:40] if len(filename) <= 40 else filename[:37] + "...",
+                    refresh=False,
+                )
+                pbar.update(len(loudness_stats))
+        except BaseException:
+            # Failed batch or Ctrl-C: cancel the queued batches instead of running
+            # them, and wait for the running ones, which replace their files in place
+            executor.shutdown(cancel_futures=True)
+            for future in futures:
+                if (
+                    future not in recorded
+                    and not future.cancelled()
+                    and future.exception() is None
+                ):
+                    record(future)
+            raise
+        finally:
+            # Keep track of completed files even if a later batch fails
+            _save_normalize_cache(output_dir, cache)
+
+    logger.info("\n✅ Volume normalization completed successfully!")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_ffprobe_path(ffmpeg_path):
+    """
+    Find the ffprobe executable next to ffmpeg, or in PATH.
+    The result is cached, PATH is only searched once per ffmpeg executable.
+
+    Args:
+        ffmpeg_path (str): Path to ffmpeg executable (optional)
 
-    print("\n✅ Volume normalization completed successfully!")
+    Returns:
+        str: Path to ffprobe executable, or None if not found
+    """
+    if ffmpeg_path:
+        ffprobe_path = os.path.join(os.path.dirname(ffmpeg_path), "ffprobe")
+        if os.path.exists(ffprobe_path):
+            return ffprobe_path
+    return shutil.which("ffprobe")
 
 
 def get_audio_duration(file_path, ffmpeg_path):
     """
-    Get audio file duration in seconds using ffprobe or ffmpeg.
+    Get audio file duration in seconds from MP3 headers, ffprobe or ffmpeg.
 
     Args:
         file_path (str): Path to audio file
@@ -116,19 +543,19 @@ def get_audio_duration(file_path, ffmpeg_path):
     Returns:
         float: Duration in seconds
     """
-    if not os.path.exists(file_path):
-        print(f"❌ ERROR: File not found: {file_path}")
-        sys.exit(1)
+    # Read duration from MP3 headers first (no subprocess, accurate to ~1s on VBR)
+    # Opening the file also reports a missing file, no separate existence check
+    try:
+        from mutagen.mp3 import MP3
+
+        return MP3(file_path).info.length
+    except Exception:
+        if not os.path.isfile(file_path):
+            logger.error(f"❌ ERROR: File not found: {file_path}")
+            sys.exit(1)
 
-    # Try ffprobe first (more accurate)
-    ffprobe_path = None
-    if ffmpeg_path:
-        ffmpeg_dir = os.path.dirname(ffmpeg_path)
-        ffprobe_path = os.path.join(ffmpeg_dir, "ffprobe")
-        if not os.path.exists(ffprobe_path):
-            ffprobe_path = shutil.which("ffprobe")
-    else:
-        ffprobe_path = shutil.which("ffprobe")
+    # Fall back to ffprobe (more accurate)
+    ffprobe_path = _get_ffprobe_path(ffmpeg_path)
 
     # Use ffprobe if available
     if ffprobe_path:
@@ -158,15 +585,15 @@ def get_audio_duration(file_path, ffmpeg_path):
     )
 
     if result.returncode != 0:
-        print(f"❌ ERROR: Failed to get duration for {os.path.basename(file_path)}")
-        print(f"Error: {result.stderr}")
+        logger.error(f"❌ ERROR: Failed to get duration for {os.path.basename(file_path)}")
+        logger.error(f"Error: {result.stderr}")
         sys.exit(1)
 
     if ffprobe_path:
         # ffprobe returns duration as string
         duration_str = result.stdout.strip()
         if not duration_str:
-            print(
+            logger.error(
                 f"❌ ERROR: Could not extract duration from {os.path.basename(file_path)}"
             )
             sys.exit(1)
@@ -179,7 +606,7 @@ def get_audio_duration(file_path, ffmpeg_path):
                 duration_str = line.split("Duration:")[1].split(",")[0].strip()
                 parts = duration_str.split(":")
                 if len(parts) != 3:
-                    print(
+                    logger.error(
                         f"❌ ERROR: Could not parse duration from {os.path.basename(file_path)}"
                     )
                     sys.exit(1)
@@ -188,7 +615,7 @@ def get_audio_duration(file_path, ffmpeg_path):
                 seconds = float(parts[2])
                 return hours * 3600 + minutes * 60 + seconds
 
-    print(f"❌ ERROR: Could not extract duration from {os.path.basename(file_path)}")
+    logger.error(f"❌ ERROR: Could not extract duration from {os.path.basename(file_path)}")
     sys.exit(1)
 
 
@@ -224,27 +651,23 @@ def validate_audio_duration(output_dir, ffmpeg_path, max_duration_minutes=79):
     """
     from tqdm import tqdm
 
-    if not os.path.exists(output_dir):
-        print(f"❌ ERROR: Output directory not found: {output_dir}")
-        sys.exit(1)
-
     # Find all MP3 files
-    mp3_files = [
-        os.path.join(output_dir, f)
-        for f in os.listdir(output_dir)
-        if f.lower().endswith(".mp3") and os.path.isfile(os.path.join(output_dir, f))
-    ]
+    try:
+        mp3_files = list(_iter_mp3s(output_dir))
+    except FileNotFoundError:
+        logger.error(f"❌ ERROR: Output directory not found: {output_dir}")
+        sys.exit(1)
 
     if not mp3_files:
-        print("⚠️  No MP3 files found to validate.")
+        logger.warning("⚠️  No MP3 files found to validate.")
         return
 
     max_duration_seconds = max_duration_minutes * 60
     invalid_files = []
     total_duration_seconds = 0.0
 
-    print(f"\n⏱️  Validating duration for {len(mp3_files)} file(s)...")
-    print(f"📏 Maximum allowed duration per file: {max_duration_minutes} minutes")
+    logger.info(f"\n⏱️  Validating duration for {len(mp3_files)} file(s)...")
+    logger.info(f"📏 Maximum allowed duration per file: {max_duration_minutes} minutes")
 
     # Use progress bar for validation
     with tqdm(
@@ -253,39 +676,55 @@ def validate_audio_duration(output_dir, ffmpeg_path, max_duration_minutes=79):
         unit="file",
         bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
         ncols=100,
-    ) as pbar:
-        for mp3_file in mp3_files:
-            filename = os.path.basename(mp3_file)
-            pbar.set_postfix_str(filename[:40] if len(filename) <= 40 else filename[:37] + "...")
-            duration = get_audio_duration(mp3_file, ffmpeg_path)
-            duration_minutes = duration / 60
-            total_duration_seconds += duration
-
-            if duration > max_duration_seconds:
-                invalid_files.append((filename, duration_minutes))
-            pbar.update(1)
+        mininterval=0.5,  # Limit terminal redraws when files complete quickly
+        miniters=1,
+    ) as pbar, ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {
+            executor.submit(get_audio_duration, mp3_file, ffmpeg_path): mp3_file
+            for mp3_file in mp3_files
+        }
+        try:
+            for future in as_completed(futures):
+                # Re-raise worker errors (including sys.exit) in the main thread
+                duration = future.result()
+                filename = os.path.basename(futures[future])
+                # Postfix is drawn with the next throttled update, not immediately
+                pbar.set_postfix_str(
+                    filename[:40] if len(filename) <= 40 else filename[:37] + "...",
+                    refresh=False,
+                )
+                duration_minutes = duration / 60
+                total_duration_seconds += duration
+
+                if duration > max_duration_seconds:
+                    invalid_files.append((filename, duration_minutes))
+                pbar.update(1)
+        except BaseException:
+            # Failed file or Ctrl-C: do not probe the files still queued
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
     # Calculate total duration
     total_duration_minutes = total_duration_seconds / 60
     total_duration_hours = total_duration_minutes / 60
 
     if invalid_files:
-        print(
+        logger.error(
             f"\n❌ ERROR: {len(invalid_files)} file(s) exceed the maximum duration of {max_duration_minutes} minutes:"
         )
-        for filename, duration_min in invalid_files:
-            print(
+        for filename, duration_min in sorted(invalid_files):
+            logger.error(
                 f"  - {filename}: {duration_min:.2f} minutes ({format_duration(duration_min * 60)})"
             )
         sys.exit(1)
     else:
-        print(f"\n✅ All files are valid (all under {max_duration_minutes} minutes per file)")
+        logger.info(f"\n✅ All files are valid (all under {max_duration_minutes} minutes per file)")
         # Display total duration
         if total_duration_hours >= 1:
-            print(
+            logger.info(
                 f"🎵 Total playlist duration: {total_duration_hours:.2f} hours ({format_duration(total_duration_seconds)})"
             )
         else:
-            print(
+            logger.info(
                 f"🎵 Total playlist duration: {total_duration_minutes:.2f} minutes ({format_duration(total_duration_seconds)})"
             )
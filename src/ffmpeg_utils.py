@@ -1,21 +1,72 @@
 import os
+import logging
 import sys
 import shutil
+import hashlib
+import functools
+import subprocess
 import platform
 import urllib.request
 import tarfile
+import tempfile
 import stat
 
+logger = logging.getLogger(__name__)
 
+# Map machine names to static build architectures (johnvansickle.com)
+_ARCH_MAP = {
+    "x86_64": "amd64",
+    "amd64": "amd64",
+    "aarch64": "arm64",
+    "arm64": "arm64",
+    "armv7l": "armhf",
+    "armv6l": "armel",
+}
+_SUPPORTED_ARCHES = frozenset({"amd64", "arm64", "armhf", "armel"})
+
+# MP3 encoders usable for normalization, in order of preference
+# (libshine: fixed-point, faster than LAME at a slight quality cost; mp3_mf: Windows Media Foundation)
+MP3_ENCODERS = ("libmp3lame", "libshine", "mp3_mf")
+
+# Platform never changes during a run
+_MACHINE = platform.machine().lower()
+_SYSTEM = platform.system().lower()
+
+# ffmpeg found in PATH, looked up once (shutil.which stats every PATH directory)
+SYSTEM_FFMPEG = shutil.which("ffmpeg")
+
+
+class _HashingReader:
+    """
+    File-like wrapper that hashes everything read from the wrapped stream.
+    Lets tarfile extract from an HTTP response while the archive checksum is computed.
+    """
+
+    def __init__(self, stream, hash_obj):
+        self.stream = stream
+        self.hash_obj = hash_obj
+
+    def read(self, size=-1):
+        data = self.stream.read(size)
+        self.hash_obj.update(data)
+        return data
+
+    def drain(self, chunk_size=1 << 20):
+        """Read (and hash) the rest of the stream."""
+        for _ in iter(lambda: self.read(chunk_size), b""):
+            pass
+
+
+@functools.lru_cache(maxsize=None)
 def get_ffmpeg_path():
     """
     Get ffmpeg executable path. If not found in PATH, download a static binary locally.
     Returns the path to ffmpeg executable.
+    The result is cached, the lookup only runs once per process.
     """
     # First, check if ffmpeg is available in PATH
-    ffmpeg_path = shutil.which("ffmpeg")
-    if ffmpeg_path:
-        return ffmpeg_path
+    if SYSTEM_FFMPEG:
+        return SYSTEM_FFMPEG
 
     # Get repository root directory
     # Get the directory where this module is located, then go up to repo root
@@ -25,38 +76,32 @@ def get_ffmpeg_path():
     local_ffmpeg_dir = os.path.join(repo_root, ".local", "ffmpeg")
     local_ffmpeg_bin = os.path.join(local_ffmpeg_dir, "ffmpeg")
 
-    # Check if local binary already exists
-    if os.path.exists(local_ffmpeg_bin) and os.access(local_ffmpeg_bin, os.X_OK):
-        return local_ffmpeg_bin
+    # Check if local binary already exists (single stat for existence and exec bit)
+    try:
+        if os.stat(local_ffmpeg_bin).st_mode & stat.S_IXUSR:
+            return local_ffmpeg_bin
+    except FileNotFoundError:
+        pass
 
     # Determine platform and architecture
-    machine = platform.machine().lower()
-    system = platform.system().lower()
+    machine = _MACHINE
+    system = _SYSTEM
 
     # Only support Linux for automatic download
     if system != "linux":
-        print("ERROR: ffmpeg is not installed or not in PATH.")
-        print("ffmpeg is required for audio conversion to MP3.")
-        print("\nInstallation instructions:")
-        print("  Ubuntu/Debian: sudo apt install ffmpeg")
-        print("  macOS: brew install ffmpeg")
-        print("  Windows: Download from https://ffmpeg.org/")
+        logger.error("ERROR: ffmpeg is not installed or not in PATH.")
+        logger.error("ffmpeg is required for audio conversion to MP3.")
+        logger.error("\nInstallation instructions:")
+        logger.error("  Ubuntu/Debian: sudo apt install ffmpeg")
+        logger.error("  macOS: brew install ffmpeg")
+        logger.error("  Windows: Download from https://ffmpeg.org/")
         sys.exit(1)
 
     # Map architecture to download URL
-    arch_map = {
-        "x86_64": "amd64",
-        "amd64": "amd64",
-        "aarch64": "arm64",
-        "arm64": "arm64",
-        "armv7l": "armhf",
-        "armv6l": "armel",
-    }
-
-    arch = arch_map.get(machine, "amd64")
-    if arch not in ["amd64", "arm64", "armhf", "armel"]:
-        print(f"ERROR: Unsupported architecture: {machine}")
-        print("Please install ffmpeg manually.")
+    arch = _ARCH_MAP.get(machine, "amd64")
+    if arch not in _SUPPORTED_ARCHES:
+        logger.error(f"ERROR: Unsupported architecture: {machine}")
+        logger.error("Please install ffmpeg manually.")
         sys.exit(1)
 
     # Download URL for static ffmpeg builds (johnvansickle.com)
@@ -65,53 +110,132 @@ def get_ffmpeg_path():
     filename = f"ffmpeg-release-{arch}-static.tar.xz"
     url = f"{base_url}/{filename}"
 
-    print(f"ffmpeg not found in PATH. Downloading static binary for {arch}...")
-    print(f"URL: {url}")
+    logger.info(f"ffmpeg not found in PATH. Downloading static binary for {arch}...")
+    logger.info(f"URL: {url}")
 
     # Create local directory
     os.makedirs(local_ffmpeg_dir, exist_ok=True)
 
-    # Download the archive
-    archive_path = os.path.join(local_ffmpeg_dir, filename)
+    # Fetch the checksum published next to the archive
+    # (release builds are rolling, so a digest cannot be pinned in the code)
+    # The MD5 comes from the same host as the archive: it only detects a corrupted
+    # or truncated download, it is not an authenticity check
     try:
-        print("Downloading ffmpeg (this may take a few minutes)...")
-        urllib.request.urlretrieve(url, archive_path)
+        with urllib.request.urlopen(f"{url}.md5") as response:
+            expected_md5 = response.read().decode().split()[0].lower()
     except Exception as e:
-        print(f"ERROR: Failed to download ffmpeg: {e}")
-        print("Please install ffmpeg manually:")
-        print("  Ubuntu/Debian: sudo apt install ffmpeg")
+        logger.error(f"ERROR: Failed to download ffmpeg checksum: {e}")
+        logger.error("Please install ffmpeg manually:")
+        logger.error("  Ubuntu/Debian: sudo apt install ffmpeg")
         sys.exit(1)
 
-    # Extract the archive
+    # Extract to a temporary file, moved into place only once the checksum is
+    # verified: a failed or interrupted download never leaves an ffmpeg binary
+    # that the next run would accept
+    temp_fd, temp_bin = tempfile.mkstemp(prefix=".ffmpeg-", dir=local_ffmpeg_dir)
     try:
-        print("Extracting ffmpeg...")
-        with tarfile.open(archive_path, "r:xz") as tar:
-            # Extract only the ffmpeg binary
-            for member in tar.getmembers():
-                if member.name.endswith("/ffmpeg") and member.isfile():
-                    # Extract to local_ffmpeg_bin
-                    member.name = os.path.basename(member.name)
-                    # Use filter='data' to avoid deprecation warning in Python 3.14+
-                    tar.extract(member, local_ffmpeg_dir, filter="data")
-                    break
-    except Exception as e:
-        print(f"ERROR: Failed to extract ffmpeg: {e}")
-        sys.exit(1)
+        # Download and extract the archive in a single streaming pass
+        # (no intermediate archive on disk, the checksum is computed on the fly)
+        extracted = False
+        archive_hash = hashlib.md5(usedforsecurity=False)
+        try:
+            logger.info("Downloading and extracting ffmpeg (this may take a few minutes)...")
+            with os.fdopen(temp_fd, "wb") as temp_out, urllib.request.urlopen(
+                url
+            ) as response:
+                reader = _HashingReader(response, archive_hash)
+                with tarfile.open(fileobj=reader, mode="r|xz") as tar:
+                    # Extract only the ffmpeg binary
+                    for member in tar:
+                        if member.name.endswith("/ffmpeg") and member.isfile():
+                            shutil.copyfileobj(tar.extractfile(member), temp_out)
+                            extracted = True
+                            break
+                # The whole archive must be read to verify its checksum
+                reader.drain()
+        except Exception as e:
+            logger.error(f"ERROR: Failed to download ffmpeg: {e}")
+            logger.error("Please install ffmpeg manually:")
+            logger.error("  Ubuntu/Debian: sudo apt install ffmpeg")
+            sys.exit(1)
+
+        if archive_hash.hexdigest() != expected_md5:
+            logger.error("ERROR: Checksum mismatch for the downloaded ffmpeg archive.")
+            sys.exit(1)
+
+        if not extracted:
+            logger.error("ERROR: ffmpeg binary not found in the downloaded archive.")
+            sys.exit(1)
+
+        # Make binary executable, then move it into place
+        os.chmod(
+            temp_bin,
+            stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH,
+        )
+        os.replace(temp_bin, local_ffmpeg_bin)
+    finally:
+        # Remove the temporary binary on every failure path
+        if os.path.exists(temp_bin):
+            os.remove(temp_bin)
+
+    logger.info(f"ffmpeg successfully installed to: {local_ffmpeg_bin}")
+    return local_ffmpeg_bin
 
-    # Make binary executable
-    os.chmod(
-        local_ffmpeg_bin,
-        stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH,
-    )
 
-    # Clean up archive
-    os.remove(archive_path)
+@functools.lru_cache(maxsize=None)
+def get_available_mp3_encoders(ffmpeg_path):
+    """
+    List the MP3 encoders supported by an ffmpeg executable.
+    The result is cached, ffmpeg is only queried once per executable.
+
+    Args:
+        ffmpeg_path (str): Path to ffmpeg executable
+
+    Returns:
+        tuple: Available encoders among MP3_ENCODERS
+    """
+    result = subprocess.run(
+        [ffmpeg_path, "-hide_banner", "-encoders"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
 
-    # Verify the binary works
-    if not os.path.exists(local_ffmpeg_bin) or not os.access(local_ffmpeg_bin, os.X_OK):
-        print("ERROR: Failed to set up ffmpeg binary.")
+    if result.returncode != 0:
+        logger.error("ERROR: Failed to list ffmpeg encoders.")
         sys.exit(1)
 
-    print(f"ffmpeg successfully installed to: {local_ffmpeg_bin}")
-    return local_ffmpeg_bin
+    # Encoder lines look like: " A....D libmp3lame           libmp3lame MP3 ..."
+    names = {line.split()[1] for line in result.stdout.splitlines() if len(line.split()) > 1}
+    return tuple(encoder for encoder in MP3_ENCODERS if encoder in names)
+
+
+def get_mp3_encoder(ffmpeg_path, preferred=None, fast=False):
+    """
+    Choose the MP3 encoder used to re-encode normalized files.
+
+    Args:
+        ffmpeg_path (str): Path to ffmpeg executable
+        preferred (str): Encoder requested by the user (default: None, automatic choice)
+        fast (bool): Prefer the fastest encoder over the best quality (default: False)
+
+    Returns:
+        str: Name of the ffmpeg encoder
+    """
+    available = get_available_mp3_encoders(ffmpeg_path)
+
+    if preferred:
+        if preferred not in available:
+            logger.error(f"ERROR: MP3 encoder '{preferred}' is not supported by this ffmpeg.")
+            logger.error(f"Available MP3 encoders: {', '.join(available) or 'none'}")
+            sys.exit(1)
+        return preferred
+
+    if fast and "libshine" in available:
+        return "libshine"
+
+    if not available:
+        logger.error("ERROR: ffmpeg has no MP3 encoder (libmp3lame, libshine or mp3_mf).")
+        sys.exit(1)
 
+    return available[0]
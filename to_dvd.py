@@ -1,16 +1,244 @@
 import os
 import sys
 import argparse
+import logging
 import shutil
+import threading
+from urllib.parse import parse_qs, urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import yt_dlp
 from tqdm import tqdm
 
-from src.ffmpeg_utils import get_ffmpeg_path
-from src.audio_normalize import normalize_all_mp3_files, validate_audio_duration
+from src.ffmpeg_utils import (
+    MP3_ENCODERS,
+    SYSTEM_FFMPEG,
+    get_ffmpeg_path,
+    get_mp3_encoder,
+)
+from src.audio_convert import convert_to_mp3
+from src.audio_normalize import (
+    normalize_all_mp3_files,
+    normalize_audio_volume,
+    record_normalized_files,
+    validate_audio_duration,
+)
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of parallel downloads (more workers trigger YouTube throttling)
+MAX_DOWNLOAD_JOBS = 5
+
+# Number of fragments of a segmented (HLS/DASH) stream downloaded in parallel
+DEFAULT_CONCURRENT_FRAGMENTS = 8
+
+# yt-dlp download archive (IDs of already downloaded videos), kept at the repository
+# root: deleting files from the output directory does not download them again
+ARCHIVE_FILENAME = ".yt-dlp-archive.txt"
+
+
+def _positive_int(value):
+    """
+    argparse type for options that need a strictly positive integer.
+
+    Args:
+        value (str): Raw command-line value
+
+    Returns:
+        int: The parsed value
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _is_single_video(url):
+    """
+    Tell whether a YouTube URL points to a single video rather than a playlist.
+
+    Args:
+        url (str): URL of the YouTube playlist (or single video)
+
+    Returns:
+        bool: True for a video URL (watch?v=... or youtu.be/...) without a list= parameter
+    """
+    parsed_url = urlparse(url)
+    query = parse_qs(parsed_url.query)
+    # A video opened from a playlist (watch?v=...&list=...) downloads the playlist
+    if "list" in query:
+        return False
+    return "v" in query or parsed_url.netloc == "youtu.be"
+
+
+def _list_playlist(url, noplaylist=False, download_archive=None):
+    """
+    Extract the flat list of entries of a playlist without downloading anything.
+
+    Args:
+        url (str): URL of the YouTube playlist (or single video)
+        noplaylist (bool): Treat the URL as a single video even if it contains list=
+        download_archive (str): Path to the yt-dlp download archive (optional)
+
+    Returns:
+        list: (video URL, already in the download archive) pairs, in playlist order
+    """
+    # The archive is not given to yt-dlp: it would drop archived videos from the
+    # entries (shifting the playlist numbering) or return nothing for a single video
+    archived_ids = set()
+    if download_archive and os.path.exists(download_archive):
+        with open(download_archive, "r", encoding="utf-8") as f:
+            archived_ids = {line.strip() for line in f}
+
+    def is_archived(entry):
+        # Same IDs as yt-dlp's archive ("<extractor> <video id>")
+        extractor = entry.get("extractor_key") or entry.get("ie_key")
+        return (
+            extractor is not None
+            and yt_dlp.utils.make_archive_id(extractor, entry["id"]) in archived_ids
+        )
+
+    info_opts = {
+        "quiet": True,
+        "no_warnings": True,
+        "extract_flat": "in_playlist",
+        "noplaylist": noplaylist,
+    }
+
+    with yt_dlp.YoutubeDL(info_opts) as ydl:
+        info = ydl.extract_info(url, download=False)
+
+    if "entries" not in info:
+        return [(url, is_archived(info))]
+
+    return [
+        (entry.get("url") or entry["id"], is_archived(entry))
+        for entry in info["entries"]
+        if entry is not None
+    ]
+
+
+# Per-thread state of the download workers
+_worker = threading.local()
+
+
+def _init_worker(ydl_opts, worker_ydls):
+    """
+    Create the YoutubeDL instance reused by a download worker thread.
+    Extractors and the format selector are initialized once per worker
+    instead of once per video.
+
+    Args:
+        ydl_opts (dict): yt-dlp options shared by all videos
+        worker_ydls (list): Collects the created instances so they can be closed
+    """
+    _worker.ydl = yt_dlp.YoutubeDL(ydl_opts)
+    worker_ydls.append(_worker.ydl)
+
+
+def _download_one(entry_url, extra_info, stop=None):
+    """
+    Download a single video with the YoutubeDL instance of the current worker.
+
+    Args:
+        entry_url (str): URL of the video
+        extra_info (dict): Extra fields for the output template (e.g. playlist_index)
+        stop (threading.Event): Skip the download once set (optional)
+
+    Returns:
+        dict: Info of the downloaded video, or None if skipped
+    """
+    if stop is not None and stop.is_set():
+        return None
+    return _worker.ydl.extract_info(entry_url, download=True, extra_info=extra_info)
+
+
+def _run_downloads(
+    entries, ydl_opts, max_workers, keep_going=False, on_downloaded=None, stop=None
+):
+    """
+    Download videos in parallel, each worker thread reusing its own YoutubeDL.
+
+    Args:
+        entries (list): (video URL, extra_info) pairs to download
+        ydl_opts (dict): yt-dlp options shared by all videos
+        max_workers (int): Number of parallel downloads
+        keep_going (bool): Collect failed videos instead of stopping at the first error
+        on_downloaded (callable): Called from the calling thread with the info of each
+            downloaded video, as soon as it completes (optional)
+        stop (threading.Event): Skip the downloads not started yet once set (optional)
+
+    Returns:
+        list: (video URL, extra_info, error) for each failed video (empty unless keep_going)
+    """
+    failures = []
+    worker_ydls = []
+    try:
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(ydl_opts, worker_ydls),
+        ) as executor:
+            futures = {
+                executor.submit(_download_one, entry_url, extra_info, stop): (
+                    entry_url,
+                    extra_info,
+                )
+                for entry_url, extra_info in entries
+            }
+            handled = set()
+            try:
+                for future in as_completed(futures):
+                    handled.add(future)
+                    try:
+                        info = future.result()
+                    except yt_dlp.utils.DownloadError as e:
+                        if not keep_going:
+                            raise
+                        failures.append((*futures[future], e))
+                        continue
+                    if on_downloaded and info is not None:
+                        on_downloaded(info)
+            except BaseException:
+                # Fail-fast (also on Ctrl-C): do not start the remaining downloads
+                executor.shutdown(wait=False, cancel_futures=True)
+                # Downloads already running still finish: hand them over too,
+                # so that their files are not left unprocessed
+                if on_downloaded:
+                    for future in futures:
+                        if (
+                            future in handled
+                            or future.cancelled()
+                            or future.exception() is not None
+                        ):
+                            continue
+                        info = future.result()
+                        if info is not None:
+                            on_downloaded(info)
+                raise
+    finally:
+        for ydl in worker_ydls:
+            ydl.close()
+
+    return failures
 
 
 def download_playlist_as_mp3(
-    playlist_url, bitrate="320", ffmpeg_path=None, normalize=True
+    playlist_url,
+    bitrate="320",
+    ffmpeg_path=None,
+    normalize=True,
+    jobs=None,
+    concurrent_fragments=DEFAULT_CONCURRENT_FRAGMENTS,
+    retry_failed=False,
+    use_aria2c=False,
+    encoder="libmp3lame",
+    force_redownload=False,
+    vbr=False,
+    reset_archive=False,
+    target_lufs=-23.0,
 ):
     """
     Download all videos from a YouTube playlist as MP3 files at specified bitrate.
@@ -20,27 +248,57 @@ def download_playlist_as_mp3(
         bitrate (str): Audio bitrate in kbps, default is "320"
         ffmpeg_path (str): Path to ffmpeg executable (optional, will use PATH if not provided)
         normalize (bool): Whether to normalize audio volume after download (default: True)
+        jobs (int): Number of videos downloaded in parallel (default and maximum: 5)
+        concurrent_fragments (int): Number of fragments downloaded in parallel per video (default: 8)
+        retry_failed (bool): Finish the playlist and retry failed videos once instead of
+            stopping at the first error (default: False)
+        use_aria2c (bool): Download each stream over multiple connections with aria2c,
+            one video at a time (default: False)
+        encoder (str): ffmpeg MP3 encoder (default: libmp3lame)
+        force_redownload (bool): Empty the output directory and the download archive and
+            download everything again, instead of skipping videos already downloaded
+            (default: False)
+        vbr (bool): Encode with LAME's best VBR quality (-q:a 0) instead of the CBR bitrate
+            (default: False)
+        reset_archive (bool): Forget the videos recorded in the download archive and
+            download them again, keeping the output directory (default: False)
+        target_lufs (float): Target integrated loudness in LUFS (default: -23.0, EBU R128 standard)
     """
+    # More workers trigger YouTube throttling
+    if jobs and jobs > MAX_DOWNLOAD_JOBS:
+        logger.warning(
+            f"⚠️  {jobs} parallel downloads requested, limited to {MAX_DOWNLOAD_JOBS}."
+        )
+
     # Get the repository root directory (where the script is located)
     repo_root = os.path.dirname(os.path.abspath(__file__))
     output_dir = os.path.join(repo_root, "musique")
+    archive_path = os.path.join(repo_root, ARCHIVE_FILENAME)
 
-    # Clean output directory: remove all existing files before downloading
-    if os.path.exists(output_dir):
-        for filename in os.listdir(output_dir):
-            file_path = os.path.join(output_dir, filename)
-            if os.path.isfile(file_path) or os.path.islink(file_path):
-                os.remove(file_path)
-            elif os.path.isdir(file_path):
-                shutil.rmtree(file_path)
-        print(f"🧹 Cleaned output directory: {output_dir}")
-    else:
+    # Forget already downloaded videos (also when downloading everything again,
+    # the archive would skip the whole playlist otherwise)
+    if (reset_archive or force_redownload) and os.path.exists(archive_path):
+        os.remove(archive_path)
+        logger.info(f"🧹 Reset download archive: {archive_path}")
+
+    # Keep previous downloads (the archive lets them be skipped) unless forced
+    # to clean the output directory: remove all existing files before downloading
+    if force_redownload and os.path.exists(output_dir):
+        # Remove the whole tree at once and recreate it empty
+        shutil.rmtree(output_dir)
+        os.makedirs(output_dir)
+        logger.info(f"🧹 Cleaned output directory: {output_dir}")
+    elif not os.path.exists(output_dir):
         os.makedirs(output_dir)
-        print(f"📁 Created output directory: {output_dir}")
+        logger.info(f"📁 Created output directory: {output_dir}")
 
-    # Detect if URL is a single video (contains v= parameter) or a playlist
-    # If URL contains v=, force single video download even if list= is present
-    is_single_video = "v=" in playlist_url
+    # Detect if URL is a single video or a playlist
+    is_single_video = _is_single_video(playlist_url)
+
+    # VBR: yt-dlp maps a quality below 10 to LAME's -q:a scale (0 = best)
+    # and normalization re-encodes with -q:a 0 when no bitrate is given
+    if vbr:
+        bitrate = None
 
     # Configuration for yt-dlp
     # Format selector: prefer non-HLS audio formats, but fallback to HLS if needed
@@ -48,34 +306,27 @@ def download_playlist_as_mp3(
 
     # Configure ffmpeg location for yt-dlp
     # If using local binary, need to specify directory (not full path to binary)
-    if ffmpeg_path and ffmpeg_path != shutil.which("ffmpeg"):
+    if ffmpeg_path and ffmpeg_path != SYSTEM_FFMPEG:
         # Extract directory from path
         ffmpeg_dir = os.path.dirname(ffmpeg_path)
         ffmpeg_location = ffmpeg_dir
     else:
         ffmpeg_location = None  # Use system PATH
 
-    # First, extract playlist info to get total number of videos
-    info_opts = {
-        "quiet": True,
-        "no_warnings": True,
-        "extract_flat": True,
-        "noplaylist": is_single_video,
-    }
-
-    with yt_dlp.YoutubeDL(info_opts) as ydl:
-        info = ydl.extract_info(playlist_url, download=False)
-        if "entries" in info:
-            total_videos = len([e for e in info["entries"] if e is not None])
-        else:
-            total_videos = 1
+    # First, extract the flat playlist to get the URL of every video
+    entries = _list_playlist(
+        playlist_url, noplaylist=is_single_video, download_archive=archive_path
+    )
+    total_videos = len(entries)
 
     # Determine number of digits needed for padding (e.g., 3 digits for up to 999 tracks)
     # This ensures proper sorting in Windows Explorer
     # Only add numbering for playlists, not single videos
+    # Videos are downloaded one by one, so the playlist index is passed to each download
     if is_single_video or total_videos == 1:
         # Single video: no numbering needed
         outtmpl = os.path.join(output_dir, "%(title)s.%(ext)s")
+        entry_infos = [{}] * total_videos
     else:
         num_digits = len(str(total_videos)) if total_videos > 0 else 3
         if num_digits < 3:
@@ -83,91 +334,233 @@ def download_playlist_as_mp3(
         outtmpl = os.path.join(
             output_dir, f"%(playlist_index)0{num_digits}d - %(title)s.%(ext)s"
         )
+        entry_infos = [
+            {"playlist": playlist_url, "playlist_index": index}
+            for index in range(1, total_videos + 1)
+        ]
+
+    # Only download videos missing from the archive (indices stay those of the playlist)
+    pending_entries = [
+        (entry_url, extra_info)
+        for (entry_url, archived), extra_info in zip(entries, entry_infos)
+        if not archived
+    ]
+    if len(pending_entries) < total_videos:
+        logger.info(
+            f"♻️  {total_videos - len(pending_entries)} track(s) already downloaded, skipping."
+        )
 
     # Initialize progress bar
     pbar = tqdm(
-        total=total_videos,
+        total=len(pending_entries),
         desc="⬇️  Downloading",
         unit="track",
         bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
         ncols=100,
+        mininterval=0.5,  # Limit terminal redraws when tracks complete quickly
+        miniters=1,
+        smoothing=0.1,  # Steadier ETA with parallel downloads finishing in bursts
     )
 
-    # Track downloaded videos to avoid counting duplicates
-    downloaded_files = set()
-
-    def progress_hook(d):
-        """
-        Progress hook to update the progress bar when a video download completes.
-        """
-        if d["status"] == "finished":
-            filename = d.get("filename", "")
-            # Only count once per file (avoid counting both download and post-processing)
-            if filename and filename not in downloaded_files:
-                downloaded_files.add(filename)
-                # Extract just the filename without path for cleaner display
-                display_name = os.path.basename(filename)
-                # Truncate if too long
-                if len(display_name) > 40:
-                    display_name = display_name[:37] + "..."
-                pbar.set_postfix_str(display_name)
-                pbar.update(1)
-
+    # No FFmpegExtractAudio postprocessor: MP3 encoding runs in a separate pool
+    # (see below) so that it is not limited to the number of download workers
     ydl_opts = {
         "format": format_selector,
-        "postprocessors": [
-            {
-                "key": "FFmpegExtractAudio",
-                "preferredcodec": "mp3",
-                "preferredquality": bitrate,
-            }
-        ],
         "outtmpl": outtmpl,
+        # Write directly to the final name instead of a .part file renamed afterwards
+        "nopart": True,
+        # Without .part files, an interrupted download leaves a truncated stream
+        # under its final name: always download it again. Finished videos are
+        # skipped through the download archive (written once the MP3 is encoded,
+        # see encode_download), and the source stream is removed after encoding
+        "overwrites": True,
         "verbose": False,
         "quiet": True,  # Hide download logs
+        "noprogress": True,  # Hide yt-dlp's own progress lines (redrawn per chunk)
         "no_warnings": True,  # Hide warnings
         "ignoreerrors": False,  # Fail-fast: stop on errors
-        "noplaylist": is_single_video,  # If single video URL, don't download playlist
-        "extract_flat": False,  # Extract all videos in the playlist
+        "noplaylist": True,  # Each worker downloads exactly one video
         "writethumbnail": False,
         "writeinfojson": False,
         "writedescription": False,
-        # Specify ffmpeg location for postprocessors
+        # Specify ffmpeg location (merging, HLS fixups)
         "ffmpeg_location": ffmpeg_location,
         # Use native HLS downloader (more reliable than external ffmpeg for HLS)
         "hls_use_mpegts": True,  # Use MPEG-TS container for HLS (better compatibility)
+        # Fetch HLS/DASH fragments in parallel
+        "concurrent_fragment_downloads": concurrent_fragments,
+        # Download non-fragmented streams in 10 MB ranges over a kept-alive connection
+        "http_chunk_size": 10485760,
         # Retry on errors
         "retries": 10,
         "fragment_retries": 10,
-        # Progress hook
-        "progress_hooks": [progress_hook],
+        "extractor_retries": 5,
+        "file_access_retries": 5,
+        # Give up on a stalled connection after 15 s (instead of 20 s) and retry it
+        "socket_timeout": 15,
+        # Exponential backoff between retries (1, 2, 4... up to 30 s)
+        "retry_sleep_functions": {
+            "http": lambda n: min(2**n, 30),
+            "fragment": lambda n: min(2**n, 30),
+        },
     }
 
-    # Download the playlist
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        error_code = ydl.download([playlist_url])
+    # Use aria2c if requested and available (multiple connections per stream)
+    if use_aria2c:
+        if shutil.which("aria2c"):
+            ydl_opts["external_downloader"] = {"default": "aria2c"}
+            ydl_opts["external_downloader_args"] = {
+                "aria2c": ["-x", "16", "-s", "16", "-k", "1M", "--console-log-level=error"]
+            }
+        else:
+            logger.warning("⚠️  aria2c not found in PATH, using the native downloader.")
+            use_aria2c = False
+
+    # Encode each video to MP3 as soon as it is downloaded, on every core
+    archive_lock = threading.Lock()
+    # Encode future -> downloaded stream it converts
+    encode_futures = {}
+    # Set by the first failed encode: the downloads not started yet are skipped
+    stop_downloads = threading.Event()
+
+    def on_encoded(future):
+        if not future.cancelled() and future.exception() is not None:
+            stop_downloads.set()
+
+    def raise_encode_error():
+        """
+        Re-raise the first encoding error (including sys.exit) in the main thread.
+        """
+        for future in list(encode_futures):
+            if future.done() and not future.cancelled() and future.exception() is not None:
+                future.result()
+
+    def encode_download(info):
+        """
+        Convert a downloaded video to MP3, then record it in the download archive.
+        When normalization is enabled, the conversion also normalizes the volume,
+        so that each track is encoded only once.
+
+        Returns:
+            tuple: (MP3 file, its loudness) if normalized, None otherwise
+        """
+        source_file = info["requested_downloads"][0]["filepath"]
+        normalized = None
+        if normalize:
+            mp3_file = os.path.splitext(source_file)[0] + ".mp3"
+            loudness = normalize_audio_volume(
+                source_file,
+                ffmpeg_path,
+                target_lufs=target_lufs,
+                bitrate=bitrate,
+                encoder=encoder,
+                output_file=mp3_file,
+            )
+            if source_file != mp3_file:
+                os.remove(source_file)
+            normalized = (mp3_file, loudness)
+        else:
+            convert_to_mp3(source_file, ffmpeg_path, bitrate, encoder=encoder)
+        with archive_lock, open(archive_path, "a", encoding="utf-8") as f:
+            f.write(yt_dlp.utils.make_archive_id(info["extractor_key"], info["id"]) + "\n")
+        return normalized
+
+    # Download the videos in parallel
+    # aria2c already opens 16 connections per video: do not multiply them
+    max_workers = min(jobs or MAX_DOWNLOAD_JOBS, MAX_DOWNLOAD_JOBS)
+    if use_aria2c:
+        max_workers = 1
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as encode_executor:
+
+            def on_downloaded(info):
+                future = encode_executor.submit(encode_download, info)
+                encode_futures[future] = info["requested_downloads"][0]["filepath"]
+                future.add_done_callback(on_encoded)
+
+                # Called from this thread as each download completes: the progress
+                # bar needs no lock and each video is counted exactly once
+                display_name = os.path.basename(info["requested_downloads"][0]["filepath"])
+                # Truncate if too long
+                if len(display_name) > 40:
+                    display_name = display_name[:37] + "..."
+                # Postfix is drawn with the next throttled update, not immediately
+                pbar.set_postfix_str(display_name, refresh=False)
+                pbar.update(1)
+
+            try:
+                failures = _run_downloads(
+                    pending_entries,
+                    ydl_opts,
+                    max_workers,
+                    keep_going=retry_failed,
+                    on_downloaded=on_downloaded,
+                    stop=stop_downloads,
+                )
+                raise_encode_error()
+                if failures:
+                    # Retry failed videos once, one at a time, then fail-fast
+                    pbar.write(f"⚠️  Retrying {len(failures)} failed download(s)...")
+                    _run_downloads(
+                        [(entry_url, extra_info) for entry_url, extra_info, _ in failures],
+                        ydl_opts,
+                        max_workers=1,
+                        on_downloaded=on_downloaded,
+                        stop=stop_downloads,
+                    )
+                    raise_encode_error()
+
+                # Wait for the last encodes, stopping at the first failure
+                for future in as_completed(list(encode_futures)):
+                    future.result()
+            except yt_dlp.utils.DownloadError as e:
+                pbar.close()
+                logger.error(f"\n❌ ERROR: Playlist download failed: {e}")
+                sys.exit(1)
+            except BaseException:
+                # Ctrl-C or failed encode: do not start the remaining encodes
+                encode_executor.shutdown(wait=False, cancel_futures=True)
+                raise
 
-    # Close progress bar
-    pbar.close()
+        # Close progress bar
+        pbar.close()
+    finally:
+        # The encode pool has been shut down: every future is done
+        succeeded = {}
+        for future, source_file in encode_futures.items():
+            if not future.cancelled() and future.exception() is None:
+                succeeded[future] = future.result()
+            elif os.path.exists(source_file):
+                # Encode cancelled or failed: do not leave the downloaded stream
+                # behind (the video is not archived, the next run downloads it again)
+                os.remove(source_file)
 
-    if error_code != 0:
-        print(f"\n❌ ERROR: Playlist download failed with error code: {error_code}")
-        sys.exit(1)
+        # Record the tracks normalized along the way, even if another one failed,
+        # so that they are not normalized again
+        record_normalized_files(
+            output_dir,
+            dict(result for result in succeeded.values() if result),
+            target_lufs=target_lufs,
+        )
 
-    print("\n✅ Playlist download completed successfully!")
+    logger.info("\n✅ Playlist download completed successfully!")
 
-    # Normalize audio volume if requested
+    # Normalize the files left by previous runs (downloaded with --no-normalize
+    # or interrupted), the new tracks are already normalized
     if normalize:
-        normalize_all_mp3_files(output_dir, ffmpeg_path)
+        normalize_all_mp3_files(
+            output_dir,
+            ffmpeg_path,
+            target_lufs=target_lufs,
+            bitrate=bitrate,
+            encoder=encoder,
+        )
 
     # Validate that all files are under 79 minutes and display total duration
     validate_audio_duration(output_dir, ffmpeg_path, max_duration_minutes=79)
 
 
 if __name__ == "__main__":
-    # Get ffmpeg path (downloads automatically if not found)
-    ffmpeg_path = get_ffmpeg_path()
-
     parser = argparse.ArgumentParser(
         description="Download YouTube playlist videos as MP3s"
     )
@@ -178,8 +571,91 @@ if __name__ == "__main__":
     parser.add_argument(
         "--no-normalize", action="store_true", help="Skip audio volume normalization"
     )
+    parser.add_argument(
+        "--target-lufs",
+        type=float,
+        default=-23.0,
+        help="Target loudness of the normalization in LUFS (default: -23, EBU R128)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=MAX_DOWNLOAD_JOBS,
+        help=f"Number of parallel downloads (default and maximum: {MAX_DOWNLOAD_JOBS})",
+    )
+    parser.add_argument(
+        "--concurrent-fragments",
+        type=_positive_int,
+        default=DEFAULT_CONCURRENT_FRAGMENTS,
+        help=f"Number of fragments downloaded in parallel per video (default: {DEFAULT_CONCURRENT_FRAGMENTS})",
+    )
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="Continue after a failed video and retry failed videos once at the end",
+    )
+    parser.add_argument(
+        "--aria2c",
+        action="store_true",
+        help="Download with aria2c (16 connections per video, one video at a time)",
+    )
+    parser.add_argument(
+        "--encoder",
+        choices=MP3_ENCODERS,
+        help="MP3 encoder (default: best available)",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Prefer the fastest MP3 encoder (libshine)",
+    )
+    parser.add_argument(
+        "--force-redownload",
+        action="store_true",
+        help="Empty the output directory and download the whole playlist again",
+    )
+    parser.add_argument(
+        "--reset-archive",
+        action="store_true",
+        help="Forget the videos recorded as downloaded and download them again",
+    )
+    parser.add_argument(
+        "--vbr",
+        action="store_true",
+        help="Encode in VBR at LAME's best quality (-q:a 0) instead of a constant bitrate",
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Only show warnings, errors and progress bars",
+    )
 
     args = parser.parse_args()
+
+    # Messages go to stdout through a single handler (tqdm bars use stderr)
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout,
+    )
+
+    # Get ffmpeg path (downloads automatically if not found)
+    ffmpeg_path = get_ffmpeg_path()
+
     download_playlist_as_mp3(
-        args.playlist_url, args.bitrate, ffmpeg_path, normalize=not args.no_normalize
+        args.playlist_url,
+        args.bitrate,
+        ffmpeg_path,
+        normalize=not args.no_normalize,
+        jobs=args.jobs,
+        concurrent_fragments=args.concurrent_fragments,
+        retry_failed=args.retry_failed,
+        use_aria2c=args.aria2c,
+        encoder=get_mp3_encoder(ffmpeg_path, args.encoder, args.fast),
+        force_redownload=args.force_redownload,
+        vbr=args.vbr,
+        reset_archive=args.reset_archive,
+        target_lufs=args.target_lufs,
     )